@@ -2,9 +2,13 @@
 # Original code by Håkon Måløy
 # Updated by Xavier Sánchez Díaz
 
-import copy
+from collections import deque
+from collections.abc import Hashable
 from itertools import product as prod
 
+# _POPCOUNT[mask] is the number of bits set in a 9-bit Sudoku domain mask
+_POPCOUNT = [bin(mask).count('1') for mask in range(1 << 9)]
+
 
 class Solver:
     def __init__(self):
@@ -14,28 +18,45 @@ class Solver:
         # self.domains is a dictionary of domains (lists)
         self.domains = {}
 
-        # self.constraints[i][j] is a list of legal value pairs for
+        # self.constraints[(i, j)] is a frozenset of legal value pairs for
         # the variable pair (i, j)
         self.constraints = {}
 
+        # self._support[i][j][x] is the frozenset of values y of variable j
+        # such that (x, y) is a legal value pair for the variable pair (i, j).
+        # It stays nested by variable, as two lookups with (cached) string
+        # hashes are cheaper than hashing a fresh (i, j) tuple in 'revised'
+        self._support = {}
+
+        # self.neighbors[i] is a list of the variables j for which a
+        # constraint (i, j) has been defined
+        self.neighbors = {}
+
+        # self._neighbor_arcs[i] caches the result of
+        # get_all_neighboring_arcs(i); it is reset whenever a new
+        # constraint from i is added
+        self._neighbor_arcs = {}
+
         self.numCalls = 0
         self.numFailures = 0
 
     # -------------------------------------- Method -------------------------------------------------
 
-    def add_variable(self, name: str, domain: list):
+    def add_variable(self, name: Hashable, domain: list):
         """Add a new variable to the CSP.
 
         Parameters
         ----------
-        name : str
-            The name of the variable to add
+        name : Hashable
+            The name of the variable to add, e.g. a str such as 'WA' or,
+            for Sudoku, the int ID row * 9 + col of the cell
         domain : list
             A list of the legal values for the variable
         """
         self.variables.append(name)
         self.domains[name] = list(domain)
-        self.constraints[name] = {}
+        self._support[name] = {}
+        self.neighbors[name] = []
 
     # -------------------------------------- Method -------------------------------------------------
 
@@ -71,28 +92,31 @@ class Solver:
             A list of tuples in the form (i, j), which represent a
             constraint between variable `i` and `j`
         """
-        return [(i, j) for i in self.constraints for j in self.constraints[i]]
+        return list(self.constraints)
 
     # -------------------------------------- Method -------------------------------------------------
 
-    def get_all_neighboring_arcs(self, var: str) -> list[tuple]:
-        """Get a list of all arcs/constraints going to/from variable 'var'.
+    def get_all_neighboring_arcs(self, var: Hashable) -> tuple[tuple]:
+        """Get a tuple of all arcs/constraints going to/from variable 'var'.
 
         Parameters
         ----------
-        var : str
+        var : Hashable
             Name of the variable
 
         Returns
         -------
-        list[tuple]
-            A list of all arcs/constraints in which `var` is involved
+        tuple[tuple]
+            A tuple of all arcs/constraints in which `var` is involved
         """
-        return [(i, var) for i in self.constraints[var]]
+        arcs = self._neighbor_arcs.get(var)
+        if arcs is None:
+            arcs = self._neighbor_arcs[var] = tuple((i, var) for i in self.neighbors[var])
+        return arcs
 
     # -------------------------------------- Method -------------------------------------------------
 
-    def add_constraint_one_way(self, i: str, j: str,
+    def add_constraint_one_way(self, i: Hashable, j: Hashable,
                                filter_function: callable):
         """Add a new constraint between variables 'i' and 'j'. Legal
         values are specified by supplying a function 'filter_function',
@@ -106,25 +130,68 @@ class Solver:
 
         Parameters
         ----------
-        i : str
+        i : Hashable
             Name of the first variable
-        j : str
+        j : Hashable
             Name of the second variable
         filter_function : callable
             A callable (function name) that needs to return a boolean.
             This will filter value pairs which pass the condition and
             keep away those that don't pass your filter.
         """
-        if j not in self.constraints[i]:
-            # First, get a list of all possible pairs of values
-            # between variables i and j
-            self.constraints[i][j] = self.get_all_possible_pairs(
-                self.domains[i], self.domains[j])
+        if (i, j) not in self.constraints:
+            # Start from all the possible pairs of values between
+            # variables i and j...
+            value_pairs = self.get_all_possible_pairs(self.domains[i], self.domains[j])
+        else:
+            # ...or from the pairs already allowed by a previous constraint
+            value_pairs = self.constraints[(i, j)]
 
-        # Next, filter this list of value pairs through the function
-        # 'filter_function', so that only the legal value pairs remain
-        self.constraints[i][j] = (
-            list(filter(lambda value_pair: filter_function(*value_pair), self.constraints[i][j])))
+        # Keep only the value pairs that pass 'filter_function'
+        self._set_constraint(i, j, frozenset((x, y) for (x, y) in value_pairs if filter_function(x, y)))
+
+    # -------------------------------------- Method -------------------------------------------------
+
+    def add_alldiff_pair(self, i: Hashable, j: Hashable):
+        """Add a new "i != j" constraint between variables 'i' and 'j'.
+
+        This is the same as calling add_constraint_one_way() with a
+        "different from" filter function, but the table of legal value
+        pairs is built directly, without calling a function for every
+        pair. As with add_constraint_one_way(), the constraint is only
+        added one way, from i -> j.
+
+        Parameters
+        ----------
+        i : Hashable
+            Name of the first variable
+        j : Hashable
+            Name of the second variable
+        """
+        if (i, j) not in self.constraints:
+            value_pairs = frozenset((x, y) for x in self.domains[i] for y in self.domains[j] if x != y)
+        else:
+            value_pairs = frozenset((x, y) for (x, y) in self.constraints[(i, j)] if x != y)
+        self._set_constraint(i, j, value_pairs)
+
+    # -------------------------------------- Method -------------------------------------------------
+
+    def _set_constraint(self, i: Hashable, j: Hashable, value_pairs: frozenset):
+        """Store 'value_pairs' as the legal value pairs for the variable
+        pair (i, j), and update the structures derived from the
+        constraints.
+        """
+        self._neighbor_arcs.pop(i, None)
+        if (i, j) not in self.constraints:
+            self.neighbors[i].append(j)
+        self.constraints[(i, j)] = value_pairs
+
+        # Index the legal pairs by the value of i, so that 'revised' can
+        # look up all the supporting values of j at once
+        support = {x: set() for x in self.domains[i]}
+        for (x, y) in value_pairs:
+            support[x].add(y)
+        self._support[i][j] = {x: frozenset(ys) for x, ys in support.items()}
 
     # -------------------------------------- Method -------------------------------------------------
 
@@ -139,7 +206,7 @@ class Solver:
         """
         for (i, j) in self.get_all_possible_pairs(var_list, var_list):
             if i != j:
-                self.add_constraint_one_way(i, j, lambda x, y: x != y)
+                self.add_alldiff_pair(i, j)
 
     # -------------------------------------- Method -------------------------------------------------
 
@@ -147,22 +214,25 @@ class Solver:
         """This functions starts the CSP solver and returns the found
         solution.
         """
-        # Make a so-called "deep copy" of the dictionary containing the
-        # domains of the CSP variables. The deep copy is required to
+        # Make a copy of the dictionary containing the domains of the CSP
+        # variables, copying each domain list as well. This is required to
         # ensure that any changes made to 'assignment' does not have any
         # side effects elsewhere.
-        assignment = copy.deepcopy(self.domains)
+        assignment = {Xi: list(Di) for Xi, Di in self.domains.items()}
 
         # Run AC-3 on all constraints in the CSP, to weed out all the
-        # values that are not arc-consistent to begin with
-        self.ac3_inference(assignment, self.get_all_arcs())
+        # values that are not arc-consistent to begin with. Later inferences
+        # only start from the variable just assigned, so an inconsistency
+        # found here must end the search right away
+        if not self.ac3_inference(assignment, self.get_all_arcs()):
+            return None
 
         # Call backtrack with the partial assignment 'assignment'
         return self.backtrack(assignment)
 
     # -------------------------------------- Method -------------------------------------------------
 
-    def backtrack(self, assignment: dict):
+    def backtrack(self, assignment: dict, n_unassigned: int = None):
         """The function 'Backtrack' from the pseudocode in the
         textbook.
 
@@ -180,22 +250,32 @@ class Solver:
         should get reduced as AC-3 discovers illegal values.
 
         IMPORTANT: For every iteration of the for-loop in the
-        pseudocode, you need to make a deep copy of 'assignment' into a
-        new variable before changing it. Every iteration of the for-loop
-        should have a clean slate and not see any traces of the old
-        assignments and inferences that took place in previous
-        iterations of the loop.
+        pseudocode, you need to make a copy of 'assignment' (and of each
+        of its domain lists) into a new variable before changing it.
+        Every iteration of the for-loop should have a clean slate and
+        not see any traces of the old assignments and inferences that
+        took place in previous iterations of the loop.
+
+        'n_unassigned' is the number of variables in 'assignment' whose
+        list of legal values does not have length one. It is counted when
+        not given, and then passed down the recursion, so that checking
+        for a complete assignment does not need to walk 'assignment'.
         """
         self.numCalls += 1
-        if self.hasCompletedThe(assignment):
+        if n_unassigned is None:
+            n_unassigned = sum(1 for Di in assignment.values() if len(Di) != 1)
+        if n_unassigned == 0:
             return assignment
         Xi = self.selectUnassignedVariableFrom(assignment)
         for Di in assignment[Xi]:
             if self.isConsistent(Xi, Di, assignment):
-                assignmentCopy = copy.deepcopy(assignment)
+                assignmentCopy = {Xk: list(Dk) for Xk, Dk in assignment.items()}
                 assignmentCopy[Xi] = [Di]  # a new version where the solution for X1 is Di
-                if self.ac3_inference(assignmentCopy, copy.deepcopy(self.get_all_arcs())):
-                    result = self.backtrack(assignmentCopy)
+                # Only the arcs (Xk, Xi) towards the neighbors of Xi can be
+                # affected by its new value
+                n_decided = self._ac3_count_decided(assignmentCopy, self.get_all_neighboring_arcs(Xi))
+                if n_decided is not None:
+                    result = self.backtrack(assignmentCopy, n_unassigned - 1 - n_decided)
                     if result is not None:
                         return result
         self.numFailures += 1
@@ -209,20 +289,38 @@ class Solver:
         the lists of legal values for each undecided variable. 'queue'
         is the initial queue of arcs that should be visited.
         """
+        return self._ac3_count_decided(assignment, queue) is not None
+
+    # -------------------------------------- Method -------------------------------------------------
+
+    def _ac3_count_decided(self, assignment: dict, queue: list[tuple]):
+        """Same as ac3_inference(), but returns the number of variables
+        whose list of legal values was reduced to a single value, or None
+        if a list of legal values got empty.
+        """
+        n_decided = 0
+        # Arcs are visited in FIFO order, and an arc is only put at the end of
+        # the queue if it is not already waiting in it
+        queued = set(queue)
+        queue = deque(queue)
         while len(queue) > 0:
-            Xi, Xj = queue.pop()
+            arc = queue.popleft()
+            queued.discard(arc)
+            Xi, Xj = arc
             if self.revised(assignment, Xi, Xj):
                 if len(assignment[Xi]) == 0:
-                    return False
-                Xi_neighbors = list(self.get_all_neighboring_arcs(Xi))
-                for neighbor_arc in Xi_neighbors:
-                    if Xj not in neighbor_arc:  # All neighbors but Xj
+                    return None
+                if len(assignment[Xi]) == 1:
+                    n_decided += 1
+                for neighbor_arc in self.get_all_neighboring_arcs(Xi):
+                    if neighbor_arc[0] != Xj and neighbor_arc not in queued:  # All neighbors but Xj
                         queue.append(neighbor_arc)
-        return True
+                        queued.add(neighbor_arc)
+        return n_decided
 
     # -------------------------------------- Method -------------------------------------------------
 
-    def revised(self, assignment: dict, Xi: str, Xj: str):
+    def revised(self, assignment: dict, Xi: Hashable, Xj: Hashable):
         """The function 'Revise' from the pseudocode in the textbook.
         'assignment' is the current partial assignment, that contains
         the lists of legal values for each undecided variable. 'i' and
@@ -233,48 +331,54 @@ class Solver:
 
         Constraint-based pruning
         """
-        revised = False
-        constraints_Xi_Xj = self.constraints[Xi][Xj]
-        notSatisfyingValues = []
-        Di = list(assignment[Xi])
-        Dj = list(assignment[Xj])
-
-        for x_in_Di in Di:
-            satisfies = False
-            for y_in_Dj in Dj:
-                if (x_in_Di, y_in_Dj) in constraints_Xi_Xj:
-                    satisfies = True
-            if not satisfies:
-                notSatisfyingValues.append(x_in_Di)
-                revised = True
-
-        # removes all the not satisfying x from Di
-        for x in notSatisfyingValues:
-            Di.remove(x)
-        assignment[Xi] = Di
-        return revised
+        support_Xi_Xj = self._support[Xi][Xj]
+        Di = assignment[Xi]
+        Dj = assignment[Xj]
+
+        # x is satisfied if at least one supporting value is still in Dj;
+        # isdisjoint walks Dj directly, without copying it, and stops at
+        # the first support found
+        for index, x_in_Di in enumerate(Di):
+            if support_Xi_Xj[x_in_Di].isdisjoint(Dj):
+                break
+        else:
+            return False
+
+        # removes all the not satisfying x from Di in a single pass: the
+        # values before 'index' are already known to be satisfied, and the
+        # one at 'index' is not
+        assignment[Xi] = Di[:index] + [x for x in Di[index + 1:] if not support_Xi_Xj[x].isdisjoint(Dj)]
+        return True
 
     # -------------------------------------- Method -------------------------------------------------
 
     @staticmethod
-    def selectUnassignedVariableFrom(assignment: dict[str, list]) -> str:
+    def selectUnassignedVariableFrom(assignment: dict[Hashable, list]) -> Hashable:
         """The function 'Select-Unassigned-Variable' from the pseudocode
         in the textbook. Should return the name of one of the variables
         in 'assignment' that have not yet been decided, i.e. whose list
         of legal values has a length greater than one.
 
+        Uses the "minimum remaining values" (fail-first) heuristic.
+
         Return:
-            The first variable holding a list of possible values (domain) greater than one.
+            The variable holding the smallest list of possible values (domain) greater than one, or None if
+            every variable has been decided.
         """
-        for Xi, Domain in assignment.items():
-            if len(Domain) > 1:
-                return Xi
+        return min((Xi for Xi, Domain in assignment.items() if len(Domain) > 1),
+                   key=lambda Xi: len(assignment[Xi]), default=None)
 
     # -------------------------------------- Method -------------------------------------------------
 
-    @staticmethod
-    def isConsistent(Xi, Di, assignment) -> bool:
-        # TODO add more intelligence in future versions?
+    def isConsistent(self, Xi: Hashable, Di, assignment: dict) -> bool:
+        """Forward checking: verifies that the value 'Di' for the variable
+        'Xi' satisfies the constraints with every neighbor of 'Xi' that
+        has already been decided in 'assignment'.
+        """
+        for Xj in self.neighbors[Xi]:
+            Dj = assignment[Xj]
+            if len(Dj) == 1 and (Di, Dj[0]) not in self.constraints[(Xi, Xj)]:
+                return False
         return True
 
     # -------------------------------------- Method -------------------------------------------------
@@ -293,6 +397,237 @@ class Solver:
 
 
 # -------------------------------------- class CSP end ----------------------------------------------------------------
+def propagate_alldiff(domains: list[int], groups: list[list[int]],
+                      cell_groups: list[list[int]], queue: list[int]) -> bool:
+    """Enforce arc consistency on Alldiff constraints over bitmask domains.
+
+    For every group in the queue, the digits of the decided cells (those
+    whose mask has a single bit set) are removed from the masks of the
+    undecided cells. Whenever this decides a cell, the groups of that
+    cell are put back in the queue if they are not already in it, until
+    the queue is empty. 'domains' is modified in place. The loop only
+    uses integer indexing and bit operations, so it stays a tight kernel.
+
+    Parameters
+    ----------
+    domains : list[int]
+        The domain bitmask of every cell, indexed by cell ID
+    groups : list[list[int]]
+        The cell IDs covered by each Alldiff constraint
+    cell_groups : list[list[int]]
+        The indices in 'groups' of the groups covering each cell
+    queue : list[int]
+        The indices in 'groups' of the groups to visit first
+
+    Returns
+    -------
+    bool
+        False if a mask gets empty or if two decided cells of a group
+        hold the same digit, True otherwise
+    """
+    queue = list(queue)
+    queued = [False] * len(groups)
+    for g in queue:
+        queued[g] = True
+    while queue:
+        g = queue.pop()
+        queued[g] = False
+        group = groups[g]
+        fixed = 0
+        for cell in group:
+            mask = domains[cell]
+            if mask & (mask - 1) == 0:
+                if fixed & mask:
+                    return False
+                fixed |= mask
+        for cell in group:
+            mask = domains[cell]
+            if mask & (mask - 1) and mask & fixed:
+                mask &= ~fixed
+                if mask == 0:
+                    return False
+                domains[cell] = mask
+                if mask & (mask - 1) == 0:
+                    for h in cell_groups[cell]:
+                        if not queued[h]:
+                            queued[h] = True
+                            queue.append(h)
+    return True
+
+
+# -------------------------------------- function -----------------------------------------------------------------
+class SudokuSolver:
+    """A CSP solver specialized for Sudoku boards, with the same interface
+    as Solver for adding variables and Alldiff constraints and for
+    running the search.
+
+    The domain of every cell is encoded as a 9-bit integer, where bit k
+    set means that the digit k + 1 is still allowed, and every Alldiff
+    constraint is kept as the list of the cells it covers. Arc
+    consistency then boils down to removing the digits of the decided
+    cells from the other cells of each group, which only needs a few
+    integer operations instead of the pairwise constraint tables.
+
+    Cells are identified by their position in self.variables (their
+    cell ID), and an assignment is the list of the cells' bitmasks. Only
+    Alldiff constraints are supported.
+    """
+
+    def __init__(self):
+        # self.variables is a list of the variable names in the CSP
+        self.variables = []
+
+        # self.domains[cell] is the domain bitmask of the cell with that ID,
+        # kept in a flat list rather than in a dictionary
+        self.domains = []
+
+        # self.neighbors[cell] is a list of the cell IDs sharing an Alldiff
+        # constraint with the cell
+        self.neighbors = {}
+
+        # self.alldiff_groups is a list of lists of cell IDs, each one
+        # covered by an Alldiff constraint
+        self.alldiff_groups = []
+
+        # self._cell_groups[cell] is the list of the indices in
+        # self.alldiff_groups of the groups covering the cell
+        self._cell_groups = []
+
+        # self._cell_ids maps each variable name to its cell ID
+        self._cell_ids = {}
+
+        self.numCalls = 0
+        self.numFailures = 0
+
+    # -------------------------------------- Method -------------------------------------------------
+
+    def add_variable(self, name: Hashable, domain: list):
+        """Add a new cell to the Sudoku, encoding its domain as a bitmask.
+
+        Parameters
+        ----------
+        name : Hashable
+            The name of the variable to add, e.g. the int ID row * 9 + col
+            of the cell
+        domain : list
+            A list of the legal digits ('1' to '9') for the variable
+        """
+        self._cell_ids[name] = len(self.variables)
+        self.variables.append(name)
+        self.domains.append(sum(1 << (int(value) - 1) for value in set(domain)))
+        self.neighbors[self._cell_ids[name]] = []
+        self._cell_groups.append([])
+
+    # -------------------------------------- Method -------------------------------------------------
+
+    def add_all_different_constraint(self, var_list: list):
+        """Add an Alldiff constraint between all the variables in the
+        list provided.
+
+        Parameters
+        ----------
+        var_list : list
+            A list of variable names
+        """
+        cells = [self._cell_ids[name] for name in var_list]
+        for cell in cells:
+            self._cell_groups[cell].append(len(self.alldiff_groups))
+        self.alldiff_groups.append(cells)
+        for (i, j) in prod(cells, cells):
+            if i != j and j not in self.neighbors[i]:
+                self.neighbors[i].append(j)
+
+    # -------------------------------------- Method -------------------------------------------------
+
+    def backtracking_search(self):
+        """This functions starts the CSP solver and returns the found
+        solution, in the same form as Solver.backtracking_search().
+        """
+        assignment = list(self.domains)
+
+        # Visit every group once to begin with
+        if not self.ac3_inference(assignment, range(len(self.alldiff_groups))):
+            return None
+
+        solution = self.backtrack(assignment)
+        if solution is None:
+            return None
+        return {name: [str(Di.bit_length())] for name, Di in zip(self.variables, solution)}
+
+    # -------------------------------------- Method -------------------------------------------------
+
+    def backtrack(self, assignment: list[int]):
+        """Same as Solver.backtrack(), except that 'assignment' is the
+        list of the cells' domain bitmasks, and a decided cell is one
+        whose bitmask has a single bit set.
+        """
+        self.numCalls += 1
+        if self.hasCompletedThe(assignment):
+            return assignment
+        Xi = self.selectUnassignedVariableFrom(assignment)
+        remaining = assignment[Xi]
+        while remaining:
+            Di = remaining & -remaining  # lowest digit still allowed
+            remaining ^= Di
+            if self.isConsistent(Xi, Di, assignment):
+                # The domains are plain integers, so a shallow copy is enough
+                assignmentCopy = list(assignment)
+                assignmentCopy[Xi] = Di
+                # Only the groups of Xi can be affected by its new value
+                if self.ac3_inference(assignmentCopy, self._cell_groups[Xi]):
+                    result = self.backtrack(assignmentCopy)
+                    if result is not None:
+                        return result
+        self.numFailures += 1
+        return None
+
+    # -------------------------------------- Method -------------------------------------------------
+
+    def ac3_inference(self, assignment: list[int], queue: list[int]) -> bool:
+        """Enforce arc consistency on the Alldiff constraints, starting
+        from the groups whose indices are in 'queue', see
+        propagate_alldiff().
+        """
+        return propagate_alldiff(assignment, self.alldiff_groups, self._cell_groups, queue)
+
+    # -------------------------------------- Method -------------------------------------------------
+
+    @staticmethod
+    def selectUnassignedVariableFrom(assignment: list[int]) -> int:
+        """Return the undecided cell whose bitmask has the fewest bits
+        set ("minimum remaining values" heuristic), or None if every
+        cell has been decided.
+        """
+        return min((Xi for Xi, Domain in enumerate(assignment) if Domain & (Domain - 1)),
+                   key=lambda Xi: _POPCOUNT[assignment[Xi]], default=None)
+
+    # -------------------------------------- Method -------------------------------------------------
+
+    def isConsistent(self, Xi: int, Di: int, assignment: list[int]) -> bool:
+        """Forward checking: verifies that no decided neighbor of 'Xi'
+        already holds the digit encoded by the single-bit mask 'Di'.
+        """
+        for Xj in self.neighbors[Xi]:
+            if assignment[Xj] == Di:
+                return False
+        return True
+
+    # -------------------------------------- Method -------------------------------------------------
+
+    @staticmethod
+    def hasCompletedThe(assignment: list[int]) -> bool:
+        """
+        Verifies whether the assignment is complete i.e. each bitmask has one - and only one - bit set.
+        :param assignment: a list of domain bitmasks.
+        :return: True if all variable have one - and only one - solution. False if otherwise.
+        """
+        for Di in assignment:
+            if Di == 0 or Di & (Di - 1):
+                return False
+        return True
+
+
+# -------------------------------------- class SudokuSolver end -------------------------------------------------------
 def create_map_coloring_csp():
     """Instantiate a CSP representing the map coloring problem from the
     textbook. This can be useful for testing your CSP solver as you
@@ -313,43 +648,44 @@ def create_map_coloring_csp():
 
 
 # -------------------------------------- function -----------------------------------------------------------------
-def create_sudoku_csp(filename: str) -> Solver:
+def create_sudoku_csp(filename: str, solver_class: type = SudokuSolver):
     """Instantiate a CSP representing the Sudoku board found in the text
-    file named 'filename' in the current directory.
+    file named 'filename' in the current directory. The cell at (row, col)
+    is the variable named row * 9 + col.
 
     Parameters
     ----------
     filename : str
         Filename of the Sudoku board to solve
+    solver_class : type
+        The solver to instantiate: SudokuSolver, or Solver to use the
+        generic pairwise constraints instead
 
     Returns
     -------
-    Solver
-        A Solver instance
+    SudokuSolver
+        A 'solver_class' instance, by default a SudokuSolver
     """
-    solver = Solver()
-    board = list(map(lambda x: x.strip(), open(filename, 'r')))
+    solver = solver_class()
+    # Read the whole board at once, as a single string of 81 digits in
+    # row-major order, so that the position of a digit is its cell's name
+    with open(filename, 'r') as file:
+        board = ''.join(file.read().split())[:81]
 
-    for row in range(9):
-        for col in range(9):
-            if board[row][col] == '0':
-                solver.add_variable('%d-%d' % (row, col), list(map(str,
-                                                                   range(1, 10))))
-            else:
-                solver.add_variable('%d-%d' % (row, col), [board[row][col]])
+    all_digits = list(map(str, range(1, 10)))
+    for cell, digit in enumerate(board):
+        solver.add_variable(cell, all_digits if digit == '0' else [digit])
 
     for row in range(9):
-        solver.add_all_different_constraint(['%d-%d' % (row, col)
-                                             for col in range(9)])
+        solver.add_all_different_constraint([row * 9 + col for col in range(9)])
     for col in range(9):
-        solver.add_all_different_constraint(['%d-%d' % (row, col)
-                                             for row in range(9)])
+        solver.add_all_different_constraint([row * 9 + col for row in range(9)])
     for box_row in range(3):
         for box_col in range(3):
             cells = []
             for row in range(box_row * 3, (box_row + 1) * 3):
                 for col in range(box_col * 3, (box_col + 1) * 3):
-                    cells.append('%d-%d' % (row, col))
+                    cells.append(row * 9 + col)
             solver.add_all_different_constraint(cells)
 
     return solver
@@ -364,7 +700,7 @@ def print_sudoku_solution(solution):
     """
     for row in range(9):
         for col in range(9):
-            print(solution['%d-%d' % (row, col)][0], end=" "),
+            print(solution[row * 9 + col][0], end=" "),
             if col == 2 or col == 5:
                 print('|', end=" "),
         print("")
@@ -0,0 +1,122 @@
+import os
+import tempfile
+import unittest
+
+from Solver import Solver, SudokuSolver, create_sudoku_csp
+
+BOARD_DIR = os.path.dirname(os.path.abspath(__file__))
+BOARD_FILES = ['easy.txt', 'medium.txt', 'hard.txt', 'veryhard.txt']
+
+
+def write_board(rows: list[str]) -> str:
+    """Write a Sudoku board to a temporary file and return its name."""
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as file:
+        file.write('\n'.join(rows) + '\n')
+    return file.name
+
+
+class UnsolvableCspTest(unittest.TestCase):
+
+    def test_initial_inconsistency_returns_none(self):
+        solver = Solver()
+        solver.add_variable('A', [1])
+        solver.add_variable('B', [1, 2])
+        solver.add_variable('C', [1])
+        for i, j in [('A', 'C'), ('A', 'B')]:
+            solver.add_constraint_one_way(i, j, lambda x, y: x != y)
+            solver.add_constraint_one_way(j, i, lambda x, y: x != y)
+        self.assertIsNone(solver.backtracking_search())
+
+    def test_emptied_decided_variable_returns_none(self):
+        solver = Solver()
+        solver.add_variable('A', [1, 2])
+        solver.add_variable('B', [1])
+        solver.add_variable('C', [2])
+        for i, j in [('A', 'B'), ('A', 'C')]:
+            solver.add_constraint_one_way(i, j, lambda x, y: x != y)
+            solver.add_constraint_one_way(j, i, lambda x, y: x != y)
+        self.assertIsNone(solver.backtracking_search())
+
+    def test_has_completed_the_reads_assignment(self):
+        self.assertTrue(Solver.hasCompletedThe({'A': [1], 'B': [2]}))
+        self.assertFalse(Solver.hasCompletedThe({'A': [1], 'B': []}))
+        self.assertFalse(Solver.hasCompletedThe({'A': [1], 'B': [1, 2]}))
+
+    def test_unsolvable_sudoku_returns_none(self):
+        # Two 1s in the first row
+        filename = write_board(['110000000'] + ['000000000'] * 8)
+        try:
+            self.assertIsNone(create_sudoku_csp(filename).backtracking_search())
+        finally:
+            os.remove(filename)
+
+
+class SearchStateTest(unittest.TestCase):
+
+    @staticmethod
+    def create_two_variable_csp() -> Solver:
+        solver = Solver()
+        for name in ['A', 'B']:
+            solver.add_variable(name, [1, 2])
+        solver.add_constraint_one_way('A', 'B', lambda x, y: x != y)
+        solver.add_constraint_one_way('B', 'A', lambda x, y: x != y)
+        return solver
+
+    def test_backtrack_after_search_solves_new_assignment(self):
+        solver = self.create_two_variable_csp()
+        solver.backtracking_search()
+        self.assertEqual(solver.backtrack({'A': [1, 2], 'B': [1, 2]}), {'A': [1], 'B': [2]})
+
+    def test_inference_and_backtrack_on_fresh_solver(self):
+        solver = self.create_two_variable_csp()
+        assignment = {'A': [1], 'B': [1, 2]}
+        self.assertTrue(solver.ac3_inference(assignment, solver.get_all_arcs()))
+        self.assertEqual(assignment, {'A': [1], 'B': [2]})
+        self.assertEqual(self.create_two_variable_csp().backtrack({'A': [1, 2], 'B': [1, 2]}),
+                         {'A': [1], 'B': [2]})
+
+
+class SudokuBoardTest(unittest.TestCase):
+
+    @staticmethod
+    def read_givens(filename: str) -> dict:
+        with open(filename) as file:
+            board = ''.join(file.read().split())
+        return {cell: digit for cell, digit in enumerate(board) if digit != '0'}
+
+    def assert_valid_solution(self, solution: dict, givens: dict):
+        self.assertIsNotNone(solution)
+        grid = {cell: solution[cell] for cell in range(81)}
+        for cell, digits in grid.items():
+            self.assertEqual(len(digits), 1)
+        for cell, digit in givens.items():
+            self.assertEqual(grid[cell][0], digit)
+        units = ([[row * 9 + col for col in range(9)] for row in range(9)]
+                 + [[row * 9 + col for row in range(9)] for col in range(9)]
+                 + [[(box_row * 3 + row) * 9 + box_col * 3 + col for row in range(3) for col in range(3)]
+                    for box_row in range(3) for box_col in range(3)])
+        for unit in units:
+            self.assertEqual(sorted(grid[cell][0] for cell in unit), list('123456789'))
+
+    def test_shipped_boards_are_solved(self):
+        for name in BOARD_FILES:
+            filename = os.path.join(BOARD_DIR, name)
+            givens = self.read_givens(filename)
+            for solver_class in [SudokuSolver, Solver]:
+                with self.subTest(board=name, solver=solver_class.__name__):
+                    solution = create_sudoku_csp(filename, solver_class).backtracking_search()
+                    self.assert_valid_solution(solution, givens)
+
+    def test_generic_and_sudoku_solvers_agree(self):
+        for name in BOARD_FILES:
+            filename = os.path.join(BOARD_DIR, name)
+            with self.subTest(board=name):
+                sudoku_solver = create_sudoku_csp(filename)
+                generic_solver = create_sudoku_csp(filename, Solver)
+                self.assertEqual(sudoku_solver.backtracking_search(), generic_solver.backtracking_search())
+                self.assertEqual(sudoku_solver.numCalls, generic_solver.numCalls)
+                self.assertEqual(sudoku_solver.numFailures, generic_solver.numFailures)
+
+
+if __name__ == '__main__':
+    unittest.main()